@@ -1,8 +1,25 @@
 import os
 import sys
+import zlib
+import types
+import contextlib
+import mmap
+import ctypes
+import shutil
+import hashlib
 import pathlib
 import requests
 import zipfile
+import threading
+from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
 
 
 SCRIPT_DIR = (
@@ -15,7 +32,70 @@ SCRIPT_DIR = (
 PACKED_DIR = sys._MEIPASS if getattr(sys, "frozen", False) else SCRIPT_DIR  # type: ignore
 
 
+# With the optional isal extra installed, unzip_zip inflates through Intel
+# ISA-L's SIMD decoder. zipfile looks zlib up at call time, so a copy of the
+# zlib module with only decompressobj swapped leaves compression on stock zlib.
+if isal_zlib is not None:
+    isal_zipfile_zlib = types.ModuleType("zlib")
+    isal_zipfile_zlib.__dict__.update(zlib.__dict__)
+    isal_zipfile_zlib.decompressobj = isal_zlib.decompressobj  # type: ignore
+else:
+    isal_zipfile_zlib = None
+isal_inflate_lock = threading.Lock()
+isal_inflate_users = 0
+isal_inflate_original_zlib = None
+
+
+@contextlib.contextmanager
+def isal_inflate():
+    """
+    Points zipfile at the isal inflater while active, nested and concurrent
+    uses included. zipfile only has a module-level hook, so other threads
+    reading zips during that window inflate through isal as well, which decodes
+    the same deflate streams.
+    """
+    global isal_inflate_users, isal_inflate_original_zlib
+    if isal_zipfile_zlib is None:
+        yield
+        return
+
+    with isal_inflate_lock:
+        if isal_inflate_users == 0:
+            isal_inflate_original_zlib = zipfile.zlib  # type: ignore
+            zipfile.zlib = isal_zipfile_zlib  # type: ignore
+        isal_inflate_users += 1
+    try:
+        yield
+    finally:
+        with isal_inflate_lock:
+            isal_inflate_users -= 1
+            if isal_inflate_users == 0:
+                zipfile.zlib = isal_inflate_original_zlib  # type: ignore
+
+
+# Shared across every request so repeated calls reuse pooled TCP/TLS connections
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+
 def get_all_drive_letter_paths() -> list[str]:
+    if sys.platform == "win32":
+        # One bitmask call instead of probing 26 paths, which can stall for
+        # seconds on disconnected network drives
+        drive_mask = ctypes.windll.kernel32.GetLogicalDrives()  # type: ignore
+        return [
+            f"{chr(drive + ord('A'))}:\\"
+            for drive in range(0, 26)
+            if drive_mask & (1 << drive)
+        ]
+
     drive_letters = []
     for drive in range(0, 26):
         drive_letter = f"{chr(drive + ord('A'))}:\\"
@@ -28,24 +108,223 @@ def get_temp_dir() -> pathlib.Path:
     return pathlib.Path(os.path.normpath(f"{SCRIPT_DIR}/temp"))
 
 
-def download_file(url, destination_path):
+def get_github_cache_dir() -> pathlib.Path:
+    return get_temp_dir() / "gh_cache"
+
+
+# Block size used when streaming downloads to disk
+DOWNLOAD_BUFFER_SIZE = 1 << 20
+
+
+class HashingWriter:
+    """
+    File wrapper that feeds everything written through it into a hash.
+    """
+
+    def __init__(self, file, hash_object):
+        self.file = file
+        self.hash_object = hash_object
+
+    def write(self, data: bytes) -> int:
+        self.hash_object.update(data)
+        return self.file.write(data)
+
+
+def download_file(
+    url, destination_path, expected_sha256: Optional[str] = None
+) -> Optional[str]:
+    """
+    Downloads into a sibling ".part" file that is only moved into place once
+    the download completes, so destination_path never holds a truncated file.
+    A ".part" file left by an interrupted download is resumed with a Range request.
+    When expected_sha256 is given, a download with a different digest is deleted
+    instead of being moved into place.
+    Returns the SHA-256 hex digest of the downloaded file, or None on failure.
+    """
+    part_path = f"{destination_path}.part"
     try:
-        with requests.get(url, stream=True) as r:
+        resume_from = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {"Range": f"bytes={resume_from}-"} if resume_from else {}
+        # Ask for the bytes as stored so the raw stream can be written out as-is
+        headers["Accept-Encoding"] = "identity"
+        with HTTP_SESSION.get(url, headers=headers, stream=True) as r:
+            if resume_from and r.status_code == 416:
+                # The partial file is not a prefix the server can extend, start over
+                os.remove(part_path)
+                return download_file(url, destination_path, expected_sha256)
             r.raise_for_status()
-            with open(destination_path, "wb") as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    f.write(chunk)
+
+            sha256 = hashlib.sha256()
+            if r.status_code == 206:
+                content_range = r.headers.get("Content-Range", "")
+                if not content_range.startswith(f"bytes {resume_from}-"):
+                    raise Exception(f"Unexpected Content-Range: {content_range}")
+                mode = "ab"
+                # The digest has to cover the bytes from the earlier attempt too
+                with open(part_path, "rb") as existing_part:
+                    while chunk := existing_part.read(DOWNLOAD_BUFFER_SIZE):
+                        sha256.update(chunk)
+            else:
+                # A 200 means the server ignored the Range header and sent everything
+                mode = "wb"
+
+            # Reading the undecoded urllib3 stream in 1 MiB blocks skips the
+            # per-chunk generator work of iter_content
+            r.raw.decode_content = False
+            with open(part_path, mode, buffering=DOWNLOAD_BUFFER_SIZE) as f:
+                shutil.copyfileobj(
+                    r.raw, HashingWriter(f, sha256), length=DOWNLOAD_BUFFER_SIZE
+                )
+        downloaded_sha256 = sha256.hexdigest()
+        if expected_sha256 and downloaded_sha256 != expected_sha256.lower():
+            os.remove(part_path)
+            raise Exception(
+                f"Checksum mismatch: expected {expected_sha256}, got {downloaded_sha256}"
+            )
+        os.replace(part_path, destination_path)
         print(f"Downloaded: {destination_path}")
+        return downloaded_sha256
     except Exception as e:
         print(f"Failed to download {url} -> {e}")
+        return None
 
 
-def unzip_zip(zip_file: pathlib.Path, output_directory: pathlib.Path):
-    with zipfile.ZipFile(zip_file, "r") as zip_ref:
-        zip_ref.extractall(output_directory)
+# Buffer size used when copying decompressed zip members to disk
+ZIP_EXTRACT_BUFFER_SIZE = 1 << 20
 
 
-def get_paths_of_files_in_zip(zip_file: pathlib.Path) -> list[str]:
+# Mirrors ZipFile._sanitize_windows_name, used for member paths on Windows
+WINDOWS_ILLEGAL_NAME_CHARACTERS = str.maketrans(':<>|"?*', "_" * 7)
+
+
+def get_zip_member_target_path(
+    member: zipfile.ZipInfo, output_directory: pathlib.Path
+) -> pathlib.Path:
+    """
+    Maps a zip member to its output path the same way ZipFile.extract does,
+    dropping drive letters and empty, "." and ".." components so members can
+    never be written outside the output directory. On Windows, characters that
+    are illegal in file names become "_" and trailing dots are stripped.
+    """
+    arcname = member.filename.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [
+        part
+        for part in arcname.split(os.path.sep)
+        if part not in ("", os.path.curdir, os.path.pardir)
+    ]
+    if os.path.sep == "\\":
+        parts = [
+            sanitized_part
+            for part in parts
+            if (sanitized_part := part.translate(WINDOWS_ILLEGAL_NAME_CHARACTERS).rstrip("."))
+        ]
+    return output_directory.joinpath(*parts)
+
+
+# Members larger than this are decompressed into a memory-mapped, preallocated file
+ZIP_MMAP_EXTRACT_MIN_SIZE = 1 << 20
+
+
+def extract_zip_member(
+    zip_ref: zipfile.ZipFile, member: zipfile.ZipInfo, target_path: pathlib.Path
+):
+    if member.file_size > ZIP_MMAP_EXTRACT_MIN_SIZE:
+        fd = os.open(
+            target_path,
+            os.O_CREAT | os.O_RDWR | os.O_TRUNC | getattr(os, "O_BINARY", 0),
+            0o666,
+        )
+        try:
+            os.ftruncate(fd, member.file_size)
+            with mmap.mmap(fd, member.file_size) as mapped_file, zip_ref.open(
+                member
+            ) as src:
+                offset = 0
+                while chunk := src.read(ZIP_EXTRACT_BUFFER_SIZE):
+                    mapped_file[offset : offset + len(chunk)] = chunk
+                    offset += len(chunk)
+        finally:
+            os.close(fd)
+        return
+
+    with zip_ref.open(member) as src, open(
+        target_path, "wb", buffering=ZIP_EXTRACT_BUFFER_SIZE
+    ) as dst:
+        shutil.copyfileobj(src, dst, length=ZIP_EXTRACT_BUFFER_SIZE)
+
+
+def unzip_zip(
+    zip_file: pathlib.Path,
+    output_directory: pathlib.Path,
+    zip_ref: Optional[zipfile.ZipFile] = None,
+):
+    """
+    Pass an already open zip_ref of zip_file (e.g. one used to list its
+    members) to reuse it instead of opening the zip again. Its member list is
+    read from it and one worker thread extracts through it, the other workers
+    open their own handles. A zip_ref passed in is left open.
+    """
+    owned_zip_refs = []
+    if zip_ref is None:
+        zip_ref = zipfile.ZipFile(zip_file, "r")
+        owned_zip_refs.append(zip_ref)
+
+    try:
+        members = zip_ref.infolist()
+        target_paths = [
+            get_zip_member_target_path(member, output_directory) for member in members
+        ]
+
+        # Create every directory once up front instead of per extracted file
+        directories = {output_directory}
+        for member, target_path in zip(members, target_paths):
+            directories.add(target_path if member.is_dir() else target_path.parent)
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
+
+        files_to_extract = [
+            (member, target_path)
+            for member, target_path in zip(members, target_paths)
+            if not member.is_dir() and target_path != output_directory
+        ]
+
+        # ZipFile handles are not shared between threads, the first worker takes
+        # the listing handle and every other worker opens its own
+        worker_state = threading.local()
+        spare_zip_refs = [zip_ref]
+
+        def extract_one(member_and_target_path: tuple[zipfile.ZipInfo, pathlib.Path]):
+            worker_zip_ref = getattr(worker_state, "zip_ref", None)
+            if worker_zip_ref is None:
+                try:
+                    worker_zip_ref = spare_zip_refs.pop()
+                except IndexError:
+                    worker_zip_ref = zipfile.ZipFile(zip_file, "r")
+                    owned_zip_refs.append(worker_zip_ref)
+                worker_state.zip_ref = worker_zip_ref
+            extract_zip_member(worker_zip_ref, *member_and_target_path)
+
+        with isal_inflate():
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                # Consuming the results re-raises the first extraction error, if any
+                list(executor.map(extract_one, files_to_extract))
+    finally:
+        for owned_zip_ref in owned_zip_refs:
+            owned_zip_ref.close()
+
+
+def get_paths_of_files_in_zip(
+    zip_file: pathlib.Path, zip_ref: Optional[zipfile.ZipFile] = None
+) -> list[str]:
+    """
+    Pass an already open zip_ref of zip_file to list it without opening the zip
+    again, it can then be handed on to unzip_zip. A zip_ref passed in is left open.
+    """
+    if zip_ref is not None:
+        return zip_ref.namelist()
     paths_of_files_in_zip = []
     with zipfile.ZipFile(zip_file, "r") as zip_ref:
         paths_of_files_in_zip = zip_ref.namelist()
@@ -60,3 +339,13 @@ def get_contents_of_file(file_path: str) -> str:
 def save_content_to_file(content: str, file_path: str):
     with open(file_path, "w", encoding="utf-8") as file:
         file.write(content)
+
+
+def save_bytes_to_file_atomically(content: bytes, file_path: pathlib.Path):
+    """
+    Writes to a sibling temp file first so readers never observe a partial file.
+    """
+    temp_path = file_path.with_name(f"{file_path.name}.tmp")
+    with open(temp_path, "wb") as file:
+        file.write(content)
+    os.replace(temp_path, file_path)
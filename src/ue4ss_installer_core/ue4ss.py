@@ -1,7 +1,12 @@
 import os
+import re
+import json
+import hashlib
 import pathlib
 import requests
-from typing import List
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 from dataclasses import dataclass, field
 
 from ue4ss_installer_core import file_io
@@ -10,14 +15,57 @@ from ue4ss_installer_core import file_io
 cached_repo_releases_info = None
 
 
-@dataclass
+GITHUB_API_HEADERS = {"Accept": "application/vnd.github.v3+json"}
+
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+
+# Requests only the release fields that are mapped into ReleaseAssetInfo.
+# releaseAssets is not paginated, so assets beyond the first 100 of a release
+# are silently left out (UE4SS releases ship around a dozen).
+GITHUB_RELEASES_GRAPHQL_QUERY = """
+query($owner: String!, $repo: String!, $after: String) {
+  repository(owner: $owner, name: $repo) {
+    releases(first: 100, after: $after) {
+      nodes {
+        tagName
+        isPrerelease
+        createdAt
+        releaseAssets(first: 100) {
+          nodes { name downloadUrl createdAt digest }
+        }
+      }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
+
+# Maximum number of release pages after the first one requested concurrently
+RELEASE_PAGE_FETCH_WORKERS = 8
+
+
+# Lowercased files that mark an xinput1_3 based UE4SS install in Binaries/Win64
+UE4SS_XINPUT_INSTALL_FILE_NAMES = frozenset({"xinput1_3.dll", "ue4ss-settings.ini"})
+
+
+# Downloaded release zips kept in a cache dir, least recently used are evicted past this
+UE4SS_ZIP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
+@dataclass(slots=True)
 class ReleaseTagAssetInfo:
     file_name: str
     download_link: str
     created_at: str
+    # "sha256:<hex>" as reported by GitHub (REST and GraphQL), absent for assets
+    # uploaded before digests existed
+    digest: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseAssetInfo:
     tag: str
     is_prerelease: bool
@@ -27,33 +75,56 @@ class ReleaseAssetInfo:
     assets: list[ReleaseTagAssetInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryReleasesInfo:
     owner: str
     repo: str
     tags: List[ReleaseAssetInfo]
+    # Lookup tables derived from tags once, so the getters below never rescan it
+    tag_index: dict[str, ReleaseAssetInfo] = field(init=False)
+    tags_with_assets: List[str] = field(init=False)
+    normal_tags_with_assets: List[str] = field(init=False)
+    pre_release_tags_with_assets: List[str] = field(init=False)
+
+    def __post_init__(self):
+        self.tag_index = {}
+        for tag_info in self.tags:
+            self.tag_index.setdefault(tag_info.tag, tag_info)
+        self.tags_with_assets = [
+            tag_info.tag for tag_info in self.tags if tag_info.has_assets
+        ]
+        self.normal_tags_with_assets = [
+            tag_info.tag
+            for tag_info in self.tags
+            if tag_info.has_assets and not tag_info.is_prerelease
+        ]
+        self.pre_release_tags_with_assets = [
+            tag_info.tag
+            for tag_info in self.tags
+            if tag_info.has_assets and tag_info.is_prerelease
+        ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigEntry:
     key: str
     value: str
     comments: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigSection:
     header: str
     config_entries: List[ConfigEntry] = field(default_factory=list)
 
 
-def cache_repo_releases_info(owner: str, repo: str):
+def cache_repo_releases_info(owner: str, repo: str, token: Optional[str] = None):
     """
     Caches the repo releases information to avoid redundant API calls.
     """
     global cached_repo_releases_info
     if cached_repo_releases_info is None:
-        cached_repo_releases_info = get_all_release_assets(owner, repo)
+        cached_repo_releases_info = get_all_release_assets(owner, repo, token)
 
 
 def get_file_name_to_download_links_from_tag(tag: str) -> dict[str, str]:
@@ -66,36 +137,187 @@ def get_file_name_to_download_links_from_tag(tag: str) -> dict[str, str]:
             "Repo release info is not cached. Please call cache_repo_releases_info first."
         )
 
-    for tag_info in cached_repo_releases_info.tags:
-        if tag_info.tag == tag:
-            return {asset.file_name: asset.download_link for asset in tag_info.assets}
+    tag_info = cached_repo_releases_info.tag_index.get(tag)
+    if tag_info is None:
+        return {}
 
-    return {}
+    return {asset.file_name: asset.download_link for asset in tag_info.assets}
 
 
-def get_all_release_assets(owner: str, repo: str) -> RepositoryReleasesInfo:
+def _get_last_page_number(response: requests.Response, page: int) -> int:
     """
-    Fetches all release tags with metadata for a GitHub repo, sorted from newest to oldest.
+    Reads the rel="last" page number from a GitHub Link header. GitHub omits
+    the link on the last page itself, including when there is only one page.
+    """
+    last_url = response.links.get("last", {}).get("url")
+    if not last_url:
+        return page
+    query = urllib.parse.parse_qs(urllib.parse.urlparse(last_url).query)
+    return int(query.get("page", [page])[0])
+
+
+def _fetch_releases_page(
+    session: requests.Session,
+    owner: str,
+    repo: str,
+    page: int,
+    token: Optional[str] = None,
+) -> tuple[list[dict], int]:
+    """
+    Fetches a single page of the GitHub releases listing, returning its releases
+    and the number of the last page.
+    Pages are cached on disk with their ETag, so unchanged pages come back as a
+    bodyless 304. GitHub only waives the rate-limit charge for such a 304 when
+    the request is authenticated, which it is whenever a token is given.
     """
     url = f"https://api.github.com/repos/{owner}/{repo}/releases"
-    headers = {"Accept": "application/vnd.github.v3+json"}
+    cache_path = file_io.get_github_cache_dir() / f"{owner}_{repo}_p{page}.json"
+    # Holds the page's ETag and last page number, since a 304 has no body to read
+    meta_path = cache_path.with_name(f"{cache_path.stem}.meta.json")
+
+    headers = dict(GITHUB_API_HEADERS)
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    cached_meta = None
+    if cache_path.is_file() and meta_path.is_file():
+        try:
+            cached_meta = json.loads(meta_path.read_bytes())
+            headers["If-None-Match"] = cached_meta["etag"]
+        except (ValueError, KeyError):
+            cached_meta = None
+
+    response = session.get(
+        url, headers=headers, params={"page": page, "per_page": 100}
+    )
+    if response.status_code == 304 and cached_meta is not None:
+        return json.loads(cache_path.read_bytes()), cached_meta["last_page"]
+    if response.status_code != 200:
+        raise Exception(
+            f"GitHub API error: {response.status_code} - {response.text}"
+        )
 
+    releases = response.json()
+    last_page = _get_last_page_number(response, page)
+    etag = response.headers.get("ETag")
+    if etag:
+        try:
+            os.makedirs(cache_path.parent, exist_ok=True)
+            # The body is replaced before its ETag so a stale ETag can never
+            # vouch for content it does not describe.
+            file_io.save_bytes_to_file_atomically(response.content, cache_path)
+            file_io.save_bytes_to_file_atomically(
+                json.dumps({"etag": etag, "last_page": last_page}).encode("utf-8"),
+                meta_path,
+            )
+        except OSError:
+            # The cache is an optimization only; an unwritable temp dir is fine.
+            pass
+    return releases, last_page
+
+
+def _fetch_releases_graphql(owner: str, repo: str, token: str) -> list[dict]:
+    """
+    Fetches all releases through the GraphQL API, which returns only the
+    requested fields. Nodes are reshaped into the REST release layout so both
+    sources share the same mapping code.
+    """
+    headers = {"Authorization": f"bearer {token}"}
     all_releases = []
-    page = 1
+    cursor = None
 
     while True:
-        response = requests.get(
-            url, headers=headers, params={"page": page, "per_page": 100}
+        response = file_io.HTTP_SESSION.post(
+            GITHUB_GRAPHQL_URL,
+            headers=headers,
+            json={
+                "query": GITHUB_RELEASES_GRAPHQL_QUERY,
+                "variables": {"owner": owner, "repo": repo, "after": cursor},
+            },
         )
         if response.status_code != 200:
             raise Exception(
                 f"GitHub API error: {response.status_code} - {response.text}"
             )
-        releases = response.json()
-        if not releases:
-            break
-        all_releases.extend(releases)
-        page += 1
+        payload = response.json()
+        if payload.get("errors"):
+            raise Exception(f"GitHub API error: {payload['errors']}")
+
+        repository = (payload.get("data") or {}).get("repository")
+        if repository is None:
+            raise Exception(f"GitHub API error: repository {owner}/{repo} not found")
+
+        releases = repository["releases"]
+        for node in releases["nodes"]:
+            all_releases.append(
+                {
+                    "tag_name": node["tagName"],
+                    "prerelease": node["isPrerelease"],
+                    "created_at": node["createdAt"],
+                    "assets": [
+                        {
+                            "name": asset["name"],
+                            "browser_download_url": asset["downloadUrl"],
+                            "created_at": asset["createdAt"],
+                            "digest": asset.get("digest"),
+                        }
+                        for asset in node["releaseAssets"]["nodes"]
+                    ],
+                }
+            )
+
+        if not releases["pageInfo"]["hasNextPage"]:
+            return all_releases
+        cursor = releases["pageInfo"]["endCursor"]
+
+
+def _fetch_releases_rest(
+    owner: str, repo: str, token: Optional[str] = None
+) -> list[dict]:
+    # The first page tells how many pages exist, so only real pages are
+    # requested and the rest can be fetched in parallel in one round trip.
+    all_releases, last_page = _fetch_releases_page(
+        file_io.HTTP_SESSION, owner, repo, 1, token
+    )
+    if last_page <= 1:
+        return all_releases
+
+    with ThreadPoolExecutor(max_workers=RELEASE_PAGE_FETCH_WORKERS) as executor:
+        pages = executor.map(
+            lambda p: _fetch_releases_page(
+                file_io.HTTP_SESSION, owner, repo, p, token
+            ),
+            range(2, last_page + 1),
+        )
+        for releases, _ in pages:
+            all_releases.extend(releases)
+
+    return all_releases
+
+
+def get_all_release_assets(
+    owner: str, repo: str, token: Optional[str] = None
+) -> RepositoryReleasesInfo:
+    """
+    Fetches all release tags with metadata for a GitHub repo, sorted from newest to oldest.
+    GraphQL needs authentication, so the REST API is used when neither token nor
+    the GITHUB_TOKEN environment variable is set, or when the GraphQL request
+    fails (e.g. an expired or under-scoped token). REST requests carry the token
+    too, and are retried without it if it is rejected there as well.
+    """
+    token = token or os.environ.get("GITHUB_TOKEN")
+    all_releases = None
+    if token:
+        try:
+            all_releases = _fetch_releases_graphql(owner, repo, token)
+        except Exception as e:
+            print(f"GitHub GraphQL release fetch failed, falling back to REST -> {e}")
+        if all_releases is None:
+            try:
+                all_releases = _fetch_releases_rest(owner, repo, token)
+            except Exception as e:
+                print(f"Authenticated GitHub REST fetch failed, retrying without token -> {e}")
+    if all_releases is None:
+        all_releases = _fetch_releases_rest(owner, repo)
 
     sorted_releases = sorted(
         all_releases, key=lambda r: r.get("created_at", ""), reverse=True
@@ -120,6 +342,7 @@ def get_all_release_assets(owner: str, repo: str) -> RepositoryReleasesInfo:
                 file_name=asset["name"],
                 download_link=asset["browser_download_url"],
                 created_at=asset["created_at"],
+                digest=asset.get("digest"),
             )
             for asset in assets_list
         ]
@@ -142,7 +365,7 @@ def get_default_ue4ss_version_tag() -> str:
     if cached_repo_releases_info is None:
         return "latest"
     else:
-        return get_normal_release_tags_with_assets()[0]
+        return cached_repo_releases_info.normal_tags_with_assets[0]
 
 
 def is_ue4ss_installed(game_directory: pathlib.Path) -> bool:
@@ -150,24 +373,33 @@ def is_ue4ss_installed(game_directory: pathlib.Path) -> bool:
     Checks if UE4SS is installed in the provided game directory.
     """
     if os.path.isdir(game_directory):
-        for dir_one_level_in in game_directory.iterdir():
-            if not dir_one_level_in.is_dir():
-                continue
-
-            win64_dir = dir_one_level_in / "Binaries" / "Win64"
-
-            if not win64_dir.is_dir():
+        with os.scandir(game_directory) as game_dir_entries:
+            dirs_one_level_in = [
+                entry.path for entry in game_dir_entries if entry.is_dir()
+            ]
+
+        for dir_one_level_in in dirs_one_level_in:
+            win64_dir = os.path.join(dir_one_level_in, "Binaries", "Win64")
+
+            # One directory read replaces a stat() call per candidate file.
+            # Names are lowercased to keep Windows' case-insensitive matching.
+            try:
+                with os.scandir(win64_dir) as win64_entries:
+                    file_names = {
+                        entry.name.lower()
+                        for entry in win64_entries
+                        if entry.is_file()
+                    }
+            except OSError:
                 continue
 
-            if (win64_dir / "dwmapi.dll").is_file():
-                if (win64_dir / "ue4ss" / "ue4ss.dll").is_file():
+            if "dwmapi.dll" in file_names:
+                if "ue4ss.dll" in file_names:
                     return True
-                if (win64_dir / "ue4ss.dll").is_file():
+                if os.path.isfile(os.path.join(win64_dir, "ue4ss", "ue4ss.dll")):
                     return True
 
-            if (win64_dir / "xinput1_3.dll").is_file() and (
-                win64_dir / "UE4SS-settings.ini"
-            ).is_file():
+            if UE4SS_XINPUT_INSTALL_FILE_NAMES <= file_names:
                 return True
     return False
 
@@ -182,11 +414,7 @@ def get_all_tags_with_assets() -> List[str]:
             "Repo release info is not cached. Please call cache_repo_releases_info first."
         )
 
-    return [
-        tag_info.tag
-        for tag_info in cached_repo_releases_info.tags
-        if tag_info.has_assets
-    ]
+    return list(cached_repo_releases_info.tags_with_assets)
 
 
 def get_pre_release_tags_with_assets() -> List[str]:
@@ -199,11 +427,7 @@ def get_pre_release_tags_with_assets() -> List[str]:
             "Repo release info is not cached. Please call cache_repo_releases_info first."
         )
 
-    return [
-        tag_info.tag
-        for tag_info in cached_repo_releases_info.tags
-        if tag_info.has_assets and tag_info.is_prerelease
-    ]
+    return list(cached_repo_releases_info.pre_release_tags_with_assets)
 
 
 def get_normal_release_tags_with_assets() -> List[str]:
@@ -216,11 +440,7 @@ def get_normal_release_tags_with_assets() -> List[str]:
             "Repo release info is not cached. Please call cache_repo_releases_info first."
         )
 
-    return [
-        tag_info.tag
-        for tag_info in cached_repo_releases_info.tags
-        if tag_info.has_assets and not tag_info.is_prerelease
-    ]
+    return list(cached_repo_releases_info.normal_tags_with_assets)
 
 
 def parse_ue4ss_settings_file(filepath: str) -> List[ConfigSection]:
@@ -228,30 +448,34 @@ def parse_ue4ss_settings_file(filepath: str) -> List[ConfigSection]:
     current_section = None
     pending_comments = []
 
+    # Reading the whole file up front is one I/O call instead of one per line
     with open(filepath, "r", encoding="utf-8") as file:
-        for line in file:
-            stripped = line.strip()
-            if not stripped:
-                continue
-
-            if stripped.startswith("[") and stripped.endswith("]"):
-                if current_section:
-                    sections.append(current_section)
-                current_section = ConfigSection(header=stripped)
-                pending_comments = []
-            elif stripped.startswith(";"):
-                pending_comments.append(stripped)
-            elif "=" in stripped:
-                if current_section is None:
-                    current_section = ConfigSection(header="")
-                key, value = stripped.split("=", 1)
-                entry = ConfigEntry(
-                    key=key.strip(), value=value.strip(), comments=pending_comments
-                )
-                current_section.config_entries.append(entry)
-                pending_comments = []
-            else:
-                pending_comments.append(stripped)
+        lines = file.read().splitlines()
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        first_char = stripped[0]
+        if first_char == "[" and stripped[-1] == "]":
+            if current_section:
+                sections.append(current_section)
+            current_section = ConfigSection(header=stripped)
+            pending_comments = []
+        elif first_char == ";":
+            pending_comments.append(stripped)
+        elif "=" in stripped:
+            if current_section is None:
+                current_section = ConfigSection(header="")
+            key, value = stripped.split("=", 1)
+            entry = ConfigEntry(
+                key=key.strip(), value=value.strip(), comments=pending_comments
+            )
+            current_section.config_entries.append(entry)
+            pending_comments = []
+        else:
+            pending_comments.append(stripped)
 
     if current_section:
         sections.append(current_section)
@@ -271,6 +495,69 @@ def write_ue4ss_settings_file(filepath: str, sections: List[ConfigSection]) -> N
             file.write("\n")
 
 
+def patch_ue4ss_settings(
+    filepath: str, updates: dict[tuple[str, str], str]
+) -> set[tuple[str, str]]:
+    """
+    Replaces the values of the given (section, key) pairs in a single pass over
+    the file, leaving every other line, comment and spacing untouched.
+    Sections are matched like ConfigSection.header ("[General]"), bare names
+    ("General") are accepted as well, and keys before the first section use "".
+    Returns the pairs from updates that were found in the file, so callers can
+    tell which ones were missing.
+    """
+    # Normalised (section, key) -> (caller's pair, new value)
+    pending_updates = {
+        (
+            section if not section or section[0] == "[" else f"[{section}]",
+            key,
+        ): ((section, key), value)
+        for (section, key), value in updates.items()
+    }
+
+    with open(filepath, "r", encoding="utf-8", newline="") as file:
+        lines = file.read().splitlines(keepends=True)
+
+    current_section = ""
+    applied = set()
+    changed = False
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        first_char = stripped[0]
+        if first_char == "[" and stripped[-1] == "]":
+            current_section = stripped
+        elif first_char != ";" and "=" in stripped:
+            key, value = line.split("=", 1)
+            pending_update = pending_updates.get((current_section, key.strip()))
+            if pending_update is None:
+                continue
+            requested_pair, new_value = pending_update
+            applied.add(requested_pair)
+
+            value_body = value.rstrip("\r\n")
+            line_ending = value[len(value_body):]
+            old_value = value_body.strip()
+            if old_value:
+                leading_space = value_body[: value_body.index(old_value)]
+                trailing_space = value_body[len(leading_space) + len(old_value):]
+            else:
+                leading_space = value_body or (" " if key.endswith(" ") else "")
+                trailing_space = ""
+            new_line = f"{key}={leading_space}{new_value}{trailing_space}{line_ending}"
+            if new_line != line:
+                lines[index] = new_line
+                changed = True
+
+    if changed:
+        with open(filepath, "w", encoding="utf-8", newline="") as file:
+            file.write("".join(lines))
+
+    return applied
+
+
 def test_ue4ss_settings_print_out(sections: List[ConfigSection]):
     for section in sections:
         if not section.header == "":
@@ -282,54 +569,161 @@ def test_ue4ss_settings_print_out(sections: List[ConfigSection]):
         print()
 
 
-def install_latest_ue4ss_to_dir(cache_dir: str, game_exe_directory: str):
-    ue4ss_zip_path = pathlib.Path(f"{cache_dir}/ue4ss.zip")
+def get_cached_ue4ss_zip_path(
+    cache_dir: str, tag: str, asset: ReleaseTagAssetInfo
+) -> pathlib.Path:
+    """
+    Returns the cache location of a release asset. The name is keyed on the tag
+    plus a hash of the asset's link and upload time, so a re-uploaded asset
+    never reuses a stale download.
+    """
+    asset_hash = hashlib.sha256(
+        f"{asset.download_link}|{asset.created_at}".encode("utf-8")
+    ).hexdigest()[:12]
+    return pathlib.Path(cache_dir) / f"ue4ss_{get_safe_tag(tag)}_{asset_hash}.zip"
 
-    if not ue4ss_zip_path.exists():
-        if not cached_repo_releases_info:
-            cache_repo_releases_info("UE4SS-RE", "RE-UE4SS")
 
-        tag = get_default_ue4ss_version_tag()
-        file_names_to_download_links = get_file_name_to_download_links_from_tag(tag)
+def get_safe_tag(tag: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]", "_", tag)
 
-        final_download_link = next(
-            (link for link in file_names_to_download_links.values()
-             if "ue4ss" in link.lower() and "zdev" not in link.lower()),
-            None
-        )
-        if not final_download_link:
-            raise RuntimeError(f'Unable to find a compatible UE4SS release for tag "{tag}"')
 
-        file_io.download_file(
-            final_download_link,
-            str(ue4ss_zip_path),
-        )
+def find_cached_ue4ss_zip_for_tag(cache_dir: str, tag: str) -> Optional[pathlib.Path]:
+    """
+    Returns the most recently used cached zip of a tag without needing release
+    info, so a cached release can be reinstalled when GitHub is unreachable.
+    """
+    # The 12 hex digit hash keeps tag "v1" from matching a "v1_2" zip
+    pattern = f"ue4ss_{get_safe_tag(tag)}_{'[0-9a-f]' * 12}.zip"
+    cached_zips = [
+        path for path in pathlib.Path(cache_dir).glob(pattern) if path.is_file()
+    ]
+    if not cached_zips:
+        return None
+    return max(cached_zips, key=lambda path: path.stat().st_mtime)
+
+
+def install_pre_placed_ue4ss_zip(cache_dir: str, game_exe_directory: str) -> bool:
+    """
+    Installs a zip placed at cache_dir/ue4ss.zip by hand, without any API call,
+    and deletes it afterwards. Returns False when there is no such zip.
+    """
+    ue4ss_zip_path = pathlib.Path(f"{cache_dir}/ue4ss.zip")
+    if not ue4ss_zip_path.is_file():
+        return False
 
     file_io.unzip_zip(ue4ss_zip_path, pathlib.Path(game_exe_directory))
     ue4ss_zip_path.unlink()
+    return True
 
 
-def install_ue4ss_to_dir(cache_dir: str, game_exe_directory: str, release_tag: str):
-    ue4ss_zip_path = pathlib.Path(f"{cache_dir}/ue4ss.zip")
+def evict_cached_ue4ss_zips(
+    cache_dir: str, keep: pathlib.Path, max_bytes: int = UE4SS_ZIP_CACHE_MAX_BYTES
+):
+    """
+    Deletes the least recently used cached release zips until the rest fit in max_bytes.
+    """
+    with os.scandir(cache_dir) as entries:
+        cached_zips = [
+            entry
+            for entry in entries
+            if entry.is_file()
+            and entry.name.startswith("ue4ss_")
+            and entry.name.endswith(".zip")
+        ]
 
-    if not ue4ss_zip_path.exists():
-        if not cached_repo_releases_info:
-            cache_repo_releases_info("UE4SS-RE", "RE-UE4SS")
+    cached_zips.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+    total_bytes = 0
+    for entry in cached_zips:
+        total_bytes += entry.stat().st_size
+        if total_bytes > max_bytes and pathlib.Path(entry.path) != keep:
+            os.remove(entry.path)
 
-        file_names_to_download_links = get_file_name_to_download_links_from_tag(release_tag)
 
-        final_download_link = next(
-            (link for link in file_names_to_download_links.values()
-             if "ue4ss" in link.lower() and "zdev" not in link.lower()),
-            None
-        )
-        if not final_download_link:
-            raise RuntimeError(f'Unable to find a compatible UE4SS release for tag "{release_tag}"')
+def is_compatible_ue4ss_asset_name(file_name: str) -> bool:
+    """
+    Accepts the main UE4SS zip and rejects the zDEV developer build.
+    """
+    lowered_file_name = file_name.lower()
+    return "ue4ss" in lowered_file_name and "zdev" not in lowered_file_name
+
 
-        file_io.download_file(
-            final_download_link,
-            str(ue4ss_zip_path),
+def find_compatible_ue4ss_asset(tag: str) -> Optional[ReleaseTagAssetInfo]:
+    """
+    Matches on the asset file name rather than the download URL, whose
+    UE4SS-RE/RE-UE4SS path would let any asset of the repo pass the check.
+    """
+    tag_info = cached_repo_releases_info.tag_index.get(tag)  # type: ignore
+    if tag_info is None:
+        return None
+
+    for asset in tag_info.assets:
+        if is_compatible_ue4ss_asset_name(asset.file_name):
+            return asset
+    return None
+
+
+def install_ue4ss_release_to_dir(cache_dir: str, game_exe_directory: str, tag: str):
+    global cached_repo_releases_info
+    if cached_repo_releases_info is None:
+        raise Exception(
+            "Repo release info is not cached. Please call cache_repo_releases_info first."
         )
 
+    asset = find_compatible_ue4ss_asset(tag)
+    if not asset:
+        raise RuntimeError(f'Unable to find a compatible UE4SS release for tag "{tag}"')
+
+    ue4ss_zip_path = get_cached_ue4ss_zip_path(cache_dir, tag, asset)
+
+    if ue4ss_zip_path.is_file():
+        # Refresh the mtime, which doubles as the LRU timestamp for eviction
+        os.utime(ue4ss_zip_path)
+    else:
+        os.makedirs(cache_dir, exist_ok=True)
+        expected_sha256 = None
+        if asset.digest and asset.digest.startswith("sha256:"):
+            expected_sha256 = asset.digest.removeprefix("sha256:")
+        # download_file checks the digest before the zip reaches its cache name
+        if file_io.download_file(
+            asset.download_link, str(ue4ss_zip_path), expected_sha256
+        ) is None:
+            raise RuntimeError(f'Failed to download the UE4SS release for tag "{tag}"')
+        evict_cached_ue4ss_zips(cache_dir, keep=ue4ss_zip_path)
+
     file_io.unzip_zip(ue4ss_zip_path, pathlib.Path(game_exe_directory))
-    ue4ss_zip_path.unlink()
+
+
+def install_latest_ue4ss_to_dir(cache_dir: str, game_exe_directory: str):
+    if install_pre_placed_ue4ss_zip(cache_dir, game_exe_directory):
+        return
+
+    if not cached_repo_releases_info:
+        cache_repo_releases_info("UE4SS-RE", "RE-UE4SS")
+
+    install_ue4ss_release_to_dir(
+        cache_dir, game_exe_directory, get_default_ue4ss_version_tag()
+    )
+
+
+def install_ue4ss_to_dir(cache_dir: str, game_exe_directory: str, release_tag: str):
+    if install_pre_placed_ue4ss_zip(cache_dir, game_exe_directory):
+        return
+
+    if not cached_repo_releases_info:
+        try:
+            cache_repo_releases_info("UE4SS-RE", "RE-UE4SS")
+        except Exception as e:
+            # Only when GitHub is unreachable is a cached zip of the tag trusted
+            # without checking that its asset has not been re-uploaded since
+            cached_zip_path = find_cached_ue4ss_zip_for_tag(cache_dir, release_tag)
+            if cached_zip_path is None:
+                raise
+            print(
+                f"Fetching UE4SS releases failed, installing cached "
+                f"{cached_zip_path} -> {e}"
+            )
+            os.utime(cached_zip_path)
+            file_io.unzip_zip(cached_zip_path, pathlib.Path(game_exe_directory))
+            return
+
+    install_ue4ss_release_to_dir(cache_dir, game_exe_directory, release_tag)